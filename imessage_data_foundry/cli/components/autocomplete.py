@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from enum import Enum
 
 from imessage_data_foundry.llm.base import LLMProvider
-from imessage_data_foundry.llm.manager import ProviderManager
+from imessage_data_foundry.llm.manager import get_provider_manager
 
 
 class AutocompleteField(Enum):
@@ -30,7 +30,7 @@ async def _get_provider() -> LLMProvider | None:
     if _cached_provider is not None:
         return _cached_provider
     try:
-        manager = ProviderManager()
+        manager = get_provider_manager()
         _cached_provider = await manager.get_provider()
         return _cached_provider
     except Exception:
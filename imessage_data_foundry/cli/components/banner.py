@@ -28,21 +28,21 @@ def _pad_lines_to_equal_width(text: str) -> str:
     return "\n".join(padded)
 
 
+PADDED_BANNER_ART = _pad_lines_to_equal_width(BANNER_ART)
+
+
 def show_welcome(console: Console, animate: bool = True) -> None:
     console.clear()
     console.print()
 
-    padded_art = _pad_lines_to_equal_width(BANNER_ART)
-
     if animate:
-        lines = padded_art.split("\n")
-        for line in lines:
+        for line in PADDED_BANNER_ART.split("\n"):
             styled = Text(line, style="bold cyan")
             console.print(Align.center(styled))
             time.sleep(0.03)
         time.sleep(0.1)
     else:
-        banner_text = Text(padded_art, style="bold cyan")
+        banner_text = Text(PADDED_BANNER_ART, style="bold cyan")
         console.print(Align.center(banner_text))
 
     console.print()
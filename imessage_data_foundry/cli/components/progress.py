@@ -12,6 +12,12 @@ from rich.progress import (
 
 from imessage_data_foundry.conversations.generator import GenerationPhase, GenerationProgress
 
+PHASE_DISPLAY_TEXT: dict[GenerationPhase, str] = {
+    GenerationPhase.GENERATING: "Generating messages",
+    GenerationPhase.ASSIGNING_TIMESTAMPS: "Assigning timestamps",
+    GenerationPhase.WRITING_DATABASE: "Writing to database",
+}
+
 
 def create_generation_progress() -> Progress:
     return Progress(
@@ -25,19 +31,21 @@ def create_generation_progress() -> Progress:
 
 
 def phase_to_display(phase: GenerationPhase) -> str:
-    mapping = {
-        GenerationPhase.GENERATING: "Generating messages",
-        GenerationPhase.ASSIGNING_TIMESTAMPS: "Assigning timestamps",
-        GenerationPhase.WRITING_DATABASE: "Writing to database",
-    }
-    return mapping.get(phase, phase.value)
+    return PHASE_DISPLAY_TEXT.get(phase, phase.value)
 
 
 def create_progress_callback(
     progress: Progress,
     task_id: TaskID,
 ) -> Callable[[GenerationProgress], None]:
+    last_state: tuple[int, int, GenerationPhase] | None = None
+
     def callback(gen_progress: GenerationProgress) -> None:
+        nonlocal last_state
+        state = (gen_progress.generated_messages, gen_progress.total_messages, gen_progress.phase)
+        if state == last_state:
+            return
+        last_state = state
         progress.update(
             task_id,
             completed=gen_progress.generated_messages,
@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import cache
 from pathlib import Path
 from typing import Any, TypeVar
 
@@ -30,6 +31,24 @@ MAIN_MENU_CHOICES = [
     {"name": "Exit", "value": "exit"},
 ]
 
+SIMULATION_TYPE_CHOICES = [
+    {"name": "Automated - Generate all pairwise conversations", "value": "automated"},
+    {"name": "Curated - Pick specific pairs and topics", "value": "curated"},
+]
+
+MANAGE_ACTION_CHOICES = [
+    {"name": "Edit a persona", "value": "edit"},
+    {"name": "Delete a persona", "value": "delete"},
+    {"name": "< Back to main menu", "value": "back"},
+]
+
+DATABASE_EXISTS_CHOICES = [
+    {"name": "Overwrite existing database", "value": "overwrite"},
+    {"name": "Append to existing database", "value": "append"},
+    {"name": "Use a different path", "value": "new_path"},
+    {"name": "Cancel", "value": "cancel"},
+]
+
 
 def main_menu_prompt() -> str:
     result = inquirer.select(
@@ -86,15 +105,19 @@ def int_prompt(message: str, default: int, min_val: int = 1, max_val: int = 1000
     return int(result) if result is not None else default
 
 
-def enum_prompt(message: str, enum_class: type[E], default: E | None = None) -> E:
-    choices = [
+@cache
+def _enum_choices(enum_class: type[Enum]) -> list[dict[str, Any]]:
+    return [
         {"name": member.value.replace("_", " ").title(), "value": member} for member in enum_class
     ]
-    default_choice = default if default else list(enum_class)[0]
+
+
+def enum_prompt(message: str, enum_class: type[E], default: E | None = None) -> E:
+    default_choice = default if default else next(iter(enum_class))
 
     result = inquirer.select(
         message=message,
-        choices=choices,
+        choices=_enum_choices(enum_class),
         default=default_choice,
     ).execute()
     return result if result else default_choice
@@ -243,40 +266,25 @@ def conversation_seed_prompt() -> str | None:
 
 
 def simulation_type_prompt() -> str:
-    choices = [
-        {"name": "Automated - Generate all pairwise conversations", "value": "automated"},
-        {"name": "Curated - Pick specific pairs and topics", "value": "curated"},
-    ]
     result = inquirer.select(
         message="How would you like to generate conversations?",
-        choices=choices,
+        choices=SIMULATION_TYPE_CHOICES,
     ).execute()
     return result if result else "automated"
 
 
 def manage_action_prompt() -> str:
-    choices = [
-        {"name": "Edit a persona", "value": "edit"},
-        {"name": "Delete a persona", "value": "delete"},
-        {"name": "< Back to main menu", "value": "back"},
-    ]
     result = inquirer.select(
         message="What would you like to do?",
-        choices=choices,
+        choices=MANAGE_ACTION_CHOICES,
     ).execute()
     return result if result else "back"
 
 
 def database_exists_prompt(path: Path) -> tuple[str, Path | None]:
-    choices = [
-        {"name": "Overwrite existing database", "value": "overwrite"},
-        {"name": "Append to existing database", "value": "append"},
-        {"name": "Use a different path", "value": "new_path"},
-        {"name": "Cancel", "value": "cancel"},
-    ]
     action = inquirer.select(
         message=f"Database already exists at {path}. What would you like to do?",
-        choices=choices,
+        choices=DATABASE_EXISTS_CHOICES,
     ).execute()
 
     new_path = None
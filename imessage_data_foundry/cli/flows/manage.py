@@ -20,9 +20,8 @@ def run_manage(console: Console) -> None:
     console.print()
 
     with PersonaStorage() as storage:
+        personas = storage.list_all()
         while True:
-            personas = storage.list_all()
-
             if not personas:
                 console.print("[yellow]No personas found.[/yellow]")
                 console.print("[dim]Use Quick Start or Guided mode to create personas.[/dim]")
@@ -36,18 +35,22 @@ def run_manage(console: Console) -> None:
             if action == "back":
                 return
 
+            changed = False
             if action == "edit":
-                _handle_edit(console, storage, personas)
+                changed = _handle_edit(console, storage, personas)
             elif action == "delete":
-                _handle_delete(console, storage, personas)
+                changed = _handle_delete(console, storage, personas)
+
+            if changed:
+                personas = storage.list_all()
 
 
-def _handle_edit(console: Console, storage: PersonaStorage, personas: list[Persona]) -> None:
+def _handle_edit(console: Console, storage: PersonaStorage, personas: list[Persona]) -> bool:
     console.print()
     persona = select_single_persona_prompt(personas, "Select persona to edit")
 
     if persona is None:
-        return
+        return False
 
     console.print()
     console.print(persona_detail_table(persona))
@@ -80,14 +83,15 @@ def _handle_edit(console: Console, storage: PersonaStorage, personas: list[Perso
     storage.update(updated)
     console.print(f"[green]Updated {updated.name}.[/green]")
     console.print()
+    return True
 
 
-def _handle_delete(console: Console, storage: PersonaStorage, personas: list[Persona]) -> None:
+def _handle_delete(console: Console, storage: PersonaStorage, personas: list[Persona]) -> bool:
     console.print()
     persona = select_single_persona_prompt(personas, "Select persona to delete")
 
     if persona is None:
-        return
+        return False
 
     console.print()
     console.print(persona_detail_table(persona))
@@ -98,10 +102,12 @@ def _handle_delete(console: Console, storage: PersonaStorage, personas: list[Per
         console.print("[dim]Deleting it will require creating a new one for conversations.[/dim]")
         console.print()
 
-    if confirm_prompt(f"Delete {persona.name}?", default=False):
+    deleted = confirm_prompt(f"Delete {persona.name}?", default=False)
+    if deleted:
         storage.delete(persona.id)
         console.print(f"[green]Deleted {persona.name}.[/green]")
     else:
         console.print("[dim]Cancelled.[/dim]")
 
     console.print()
+    return deleted
@@ -4,9 +4,17 @@ from rich.console import Console
 from rich.panel import Panel
 
 from imessage_data_foundry.cli.components.prompts import confirm_prompt, provider_select_prompt
-from imessage_data_foundry.llm.manager import ProviderManager
+from imessage_data_foundry.llm.config import ProviderType
+from imessage_data_foundry.llm.manager import get_provider_manager
 from imessage_data_foundry.settings.storage import SettingsStorage
 
+ENABLE_PROVIDERS_MESSAGE = (
+    "[yellow]To enable more providers:[/yellow]\n"
+    "  • OpenAI: Set OPENAI_API_KEY environment variable\n"
+    "  • Anthropic: Set ANTHROPIC_API_KEY environment variable\n"
+    "  • Local: Install mlx-lm (pip install mlx-lm)"
+)
+
 
 def run_settings(console: Console) -> None:
     console.print()
@@ -16,12 +24,15 @@ def run_settings(console: Console) -> None:
     with SettingsStorage() as storage:
         current_provider = storage.get_provider()
 
-    manager = ProviderManager()
+    manager = get_provider_manager()
     all_providers = asyncio.run(manager.list_all_providers())
-    available = [(ptype, name) for ptype, name, is_avail, _ in all_providers if is_avail]
-    unavailable = [
-        (ptype, name, reason) for ptype, name, is_avail, reason in all_providers if not is_avail
-    ]
+    available: list[tuple[ProviderType, str]] = []
+    unavailable: list[tuple[str, str | None]] = []
+    for ptype, name, is_avail, reason in all_providers:
+        if is_avail:
+            available.append((ptype, name))
+        else:
+            unavailable.append((name, reason))
 
     if current_provider:
         current_name = next(
@@ -34,30 +45,24 @@ def run_settings(console: Console) -> None:
 
     console.print()
     if available:
-        console.print("[dim]Available providers:[/dim]")
+        lines = ["[dim]Available providers:[/dim]"]
         for ptype, name in available:
             marker = " [green](current)[/green]" if ptype == current_provider else ""
-            console.print(f"  [green]✓[/green] {name}{marker}")
+            lines.append(f"  [green]✓[/green] {name}{marker}")
+        console.print("\n".join(lines))
     else:
         console.print("[dim]Available providers:[/dim] [yellow]None[/yellow]")
 
     if unavailable:
         console.print()
-        console.print("[dim]Unavailable providers:[/dim]")
-        for _ptype, name, reason in unavailable:
-            console.print(f"  [red]✗[/red] {name} [dim]({reason})[/dim]")
+        lines = ["[dim]Unavailable providers:[/dim]"]
+        for name, reason in unavailable:
+            lines.append(f"  [red]✗[/red] {name} [dim]({reason})[/dim]")
+        console.print("\n".join(lines))
     console.print()
 
     if not available:
-        console.print(
-            Panel(
-                "[yellow]To enable more providers:[/yellow]\n"
-                "  • OpenAI: Set OPENAI_API_KEY environment variable\n"
-                "  • Anthropic: Set ANTHROPIC_API_KEY environment variable\n"
-                "  • Local: Install mlx-lm (pip install mlx-lm)",
-                border_style="yellow",
-            )
-        )
+        console.print(Panel(ENABLE_PROVIDERS_MESSAGE, border_style="yellow"))
         return
 
     if not confirm_prompt("Change LLM provider?", default=current_provider is None):
@@ -0,0 +1,127 @@
+import asyncio
+import time
+from pathlib import Path
+
+from rich.console import Console
+from rich.panel import Panel
+
+from imessage_data_foundry.cli.components.progress import (
+    create_generation_progress,
+    create_progress_callback,
+)
+from imessage_data_foundry.cli.components.tables import (
+    generation_stats_table,
+    message_preview_table,
+)
+from imessage_data_foundry.cli.utils import get_addressbook_path, get_default_time_range
+from imessage_data_foundry.conversations.generator import (
+    ConversationGenerator,
+    GenerationResult,
+    TimestampedMessage,
+)
+from imessage_data_foundry.db.addressbook import AddressBookBuilder
+from imessage_data_foundry.db.builder import DatabaseBuilder
+from imessage_data_foundry.llm.manager import get_provider_manager
+from imessage_data_foundry.personas.models import (
+    ChatType,
+    ConversationConfig,
+    Persona,
+    ServiceType,
+)
+
+
+def generate_conversations(
+    console: Console,
+    *,
+    output_path: Path,
+    append_mode: bool,
+    self_persona: Persona,
+    contact_personas: list[Persona],
+    conversations: list[tuple[Persona, str | None]],
+    message_count: int,
+    provider_name: str,
+) -> Path:
+    start_time, end_time = get_default_time_range()
+    all_personas = [self_persona] + contact_personas
+
+    total_time_start = time.monotonic()
+    all_messages: list[TimestampedMessage] = []
+    conversation_count = 0
+    last_provider_name = provider_name
+
+    with DatabaseBuilder(output_path, append=append_mode) as builder:
+        generator = ConversationGenerator(get_provider_manager())
+
+        with create_generation_progress() as progress:
+            for contact, seed in conversations:
+                task_desc = f"Conversation with {contact.name}"
+                task = progress.add_task(task_desc, total=message_count, phase="Starting...")
+
+                config = ConversationConfig(
+                    name=f"Chat with {contact.name}",
+                    participants=[self_persona.id, contact.id],
+                    chat_type=ChatType.DIRECT,
+                    service=ServiceType.IMESSAGE,
+                    message_count_target=message_count,
+                    time_range_start=start_time,
+                    time_range_end=end_time,
+                    seed=seed,
+                )
+
+                callback = create_progress_callback(progress, task)
+
+                try:
+                    result: GenerationResult = asyncio.run(
+                        generator.generate_to_database(
+                            personas=[self_persona, contact],
+                            config=config,
+                            builder=builder,
+                            progress_callback=callback,
+                        )
+                    )
+                    all_messages.extend(result.messages)
+                    conversation_count += 1
+                    last_provider_name = result.llm_provider_used
+
+                    progress.update(task, completed=message_count, phase="Done")
+                except Exception as e:
+                    progress.update(task, description=f"[red]Failed: {contact.name}[/red]")
+                    console.print(
+                        f"[red]Error generating conversation with {contact.name}: {e}[/red]"
+                    )
+
+    total_time = time.monotonic() - total_time_start
+
+    addressbook_path = get_addressbook_path(output_path)
+    with AddressBookBuilder(addressbook_path) as ab_builder:
+        ab_builder.add_all_personas(all_personas)
+
+    console.print()
+
+    if all_messages:
+        persona_map = {p.id: p for p in all_personas}
+        console.print(message_preview_table(all_messages, persona_map, max_messages=15))
+        console.print()
+
+    console.print(
+        generation_stats_table(
+            total_messages=len(all_messages),
+            total_conversations=conversation_count,
+            total_time=total_time,
+            provider=last_provider_name,
+            output_path=output_path,
+        )
+    )
+
+    console.print()
+    console.print(
+        Panel(
+            f"[green]iMessage database:[/green] [blue]{output_path.absolute()}[/blue]\n"
+            f"[green]AddressBook database:[/green] [blue]{addressbook_path.absolute()}[/blue]\n\n"
+            "[dim]You can use these databases with imessage-exporter or BRB.[/dim]",
+            title="Complete",
+            border_style="green",
+        )
+    )
+
+    return output_path
@@ -1,3 +1,5 @@
+from collections.abc import Callable
+
 from rich.console import Console
 
 from imessage_data_foundry.cli.components.banner import show_welcome
@@ -7,6 +9,13 @@ from imessage_data_foundry.cli.flows.manage import run_manage
 from imessage_data_foundry.cli.flows.quick_start import run_quick_start
 from imessage_data_foundry.cli.flows.settings import run_settings
 
+MENU_FLOWS: dict[str, Callable[[Console], object]] = {
+    "quick_start": run_quick_start,
+    "guided": run_guided,
+    "manage": run_manage,
+    "settings": run_settings,
+}
+
 
 def run_menu_loop(console: Console) -> None:
     show_welcome(console)
@@ -14,18 +23,11 @@ def run_menu_loop(console: Console) -> None:
     while True:
         choice = main_menu_prompt()
 
-        if choice == "quick_start":
-            run_quick_start(console)
-            console.print()
-        elif choice == "guided":
-            run_guided(console)
-            console.print()
-        elif choice == "manage":
-            run_manage(console)
-            console.print()
-        elif choice == "settings":
-            run_settings(console)
-            console.print()
-        elif choice == "exit":
+        if choice == "exit":
             console.print("[green]Goodbye![/green]")
             break
+
+        flow = MENU_FLOWS.get(choice)
+        if flow is not None:
+            flow(console)
+            console.print()
@@ -5,15 +5,23 @@ from rich.panel import Panel
 
 from imessage_data_foundry.cli.components.prompts import provider_select_prompt
 from imessage_data_foundry.llm.base import LLMProvider
-from imessage_data_foundry.llm.manager import ProviderManager, ProviderNotAvailableError
+from imessage_data_foundry.llm.manager import ProviderNotAvailableError, get_provider_manager
 from imessage_data_foundry.settings.storage import SettingsStorage
 
+NO_PROVIDERS_MESSAGE = (
+    "[red]No LLM providers available.[/red]\n\n"
+    "Options:\n"
+    "  1. Install mlx-lm for local inference: pip install mlx-lm\n"
+    "  2. Set OPENAI_API_KEY environment variable\n"
+    "  3. Set ANTHROPIC_API_KEY environment variable"
+)
+
 
 def get_provider_with_preference(console: Console) -> LLMProvider | None:
     with SettingsStorage() as storage:
         stored_provider = storage.get_provider()
 
-    manager = ProviderManager()
+    manager = get_provider_manager()
 
     if stored_provider:
         try:
@@ -29,16 +37,7 @@ def get_provider_with_preference(console: Console) -> LLMProvider | None:
     available = asyncio.run(manager.list_available_providers())
 
     if not available:
-        console.print(
-            Panel(
-                "[red]No LLM providers available.[/red]\n\n"
-                "Options:\n"
-                "  1. Install mlx-lm for local inference: pip install mlx-lm\n"
-                "  2. Set OPENAI_API_KEY environment variable\n"
-                "  3. Set ANTHROPIC_API_KEY environment variable",
-                border_style="red",
-            )
-        )
+        console.print(Panel(NO_PROVIDERS_MESSAGE, border_style="red"))
         return None
 
     if len(available) == 1:
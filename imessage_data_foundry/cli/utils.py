@@ -2,12 +2,15 @@ from datetime import UTC, datetime, timedelta
 from enum import Enum
 from pathlib import Path
 
+from rich.console import Console
+
 from imessage_data_foundry.cli.components.prompts import (
     database_exists_prompt,
     existing_self_prompt,
 )
 from imessage_data_foundry.llm.models import GeneratedPersona
 from imessage_data_foundry.personas.models import IdentifierType, Persona
+from imessage_data_foundry.personas.storage import PersonaStorage
 from imessage_data_foundry.utils.phone_numbers import generate_fake_phone
 
 
@@ -29,7 +32,8 @@ def get_addressbook_path(chat_db_path: Path) -> Path:
     return chat_db_path.parent / DEFAULT_ADDRESSBOOK_NAME
 
 
-def ensure_output_dir(output_path: Path = DEFAULT_OUTPUT_PATH) -> Path:
+def ensure_output_dir(output_path: Path | None = None) -> Path:
+    output_path = output_path or DEFAULT_OUTPUT_PATH
     output_path.parent.mkdir(parents=True, exist_ok=True)
     return output_path
 
@@ -109,3 +113,31 @@ def handle_existing_database(output_path: Path) -> tuple[DatabaseExistsAction, P
 
 def prompt_use_existing_self(existing_self: Persona) -> bool:
     return existing_self_prompt(existing_self)
+
+
+def resolve_existing_self(console: Console, append_mode: bool) -> Persona | None:
+    with PersonaStorage() as storage:
+        if not append_mode:
+            storage.delete_all()
+            return None
+
+        existing_self = storage.get_self()
+        if existing_self is None:
+            return None
+        if prompt_use_existing_self(existing_self):
+            console.print(f"[dim]Using existing self: {existing_self.name}[/dim]")
+            return existing_self
+        storage.delete(existing_self.id)
+        return None
+
+
+def save_personas(
+    self_persona: Persona,
+    contact_personas: list[Persona],
+    append_mode: bool,
+) -> None:
+    with PersonaStorage() as storage:
+        if append_mode and storage.get_self():
+            storage.create_many(contact_personas)
+        else:
+            storage.create_many([self_persona] + contact_personas)
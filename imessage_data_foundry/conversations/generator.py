@@ -102,6 +102,7 @@ class ConversationGenerator:
         self.provider_manager = provider_manager
         self.config = config or LLMConfig()
         self._partial_messages: list[GeneratedMessage] = []
+        self._provider: LLMProvider | None = None
 
     async def generate(
         self,
@@ -115,7 +116,7 @@ class ConversationGenerator:
         if errors:
             raise ValidationError("; ".join(errors))
 
-        provider = await self.provider_manager.get_provider()
+        provider = await self._resolve_provider()
         persona_descriptions = self._format_personas_for_llm(personas)
 
         messages = await self._generate_all_messages(
@@ -137,7 +138,8 @@ class ConversationGenerator:
                 )
             )
 
-        participant_personas = [p for p in personas if p.id in config.participants]
+        participant_ids = set(config.participants)
+        participant_personas = [p for p in personas if p.id in participant_ids]
         timestamps = generate_timestamps(
             start=config.time_range_start,
             end=config.time_range_end,
@@ -221,6 +223,11 @@ class ConversationGenerator:
             llm_provider_used=result.llm_provider_used,
         )
 
+    async def _resolve_provider(self) -> LLMProvider:
+        if self._provider is None:
+            self._provider = await self.provider_manager.get_provider()
+        return self._provider
+
     async def _generate_all_messages(
         self,
         provider: LLMProvider,
@@ -58,11 +58,13 @@ def get_topic_shift_hint(
     current_themes: list[str],
     rng: random.Random,
 ) -> str | None:
-    all_topics: list[str] = []
-    for persona in personas:
-        all_topics.extend(persona.topics_of_interest)
-
-    available = [t for t in all_topics if t.lower() not in [c.lower() for c in current_themes]]
+    used = {theme.lower() for theme in current_themes}
+    available = [
+        topic
+        for persona in personas
+        for topic in persona.topics_of_interest
+        if topic.lower() not in used
+    ]
 
     if not available:
         return None
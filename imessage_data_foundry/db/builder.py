@@ -16,6 +16,12 @@ from imessage_data_foundry.db.version_detect import (
 )
 from imessage_data_foundry.personas.models import Persona
 
+DEFAULT_PRAGMAS: dict[str, str | int] = {
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "cache_size": -64000,
+}
+
 
 class DatabaseBuilder:
     def __init__(
@@ -24,11 +30,13 @@ class DatabaseBuilder:
         version: str | SchemaVersion | None = None,
         in_memory: bool = False,
         append: bool = False,
+        pragmas: dict[str, str | int] | None = None,
     ) -> None:
         self.output_path = Path(output_path)
         self.version = get_schema_for_version(version) if version else detect_schema_version()
         self.in_memory = in_memory
         self.append = append
+        self.pragmas = {**DEFAULT_PRAGMAS, **(pragmas or {})}
 
         self._connection: sqlite3.Connection | None = None
         self._finalized: bool = False
@@ -57,13 +65,14 @@ class DatabaseBuilder:
         if not self.in_memory:
             self.output_path.parent.mkdir(parents=True, exist_ok=True)
 
+        self._connection = sqlite3.connect(db_path)
+        self._connection.row_factory = sqlite3.Row
+        for key, value in self.pragmas.items():
+            self._connection.execute(f"PRAGMA {key} = {value}")
+
         if self.append and self.output_path.exists() and not self.in_memory:
-            self._connection = sqlite3.connect(db_path)
-            self._connection.row_factory = sqlite3.Row
             self._load_existing_state()
         else:
-            self._connection = sqlite3.connect(db_path)
-            self._connection.row_factory = sqlite3.Row
             self._create_schema()
 
     def _create_schema(self) -> None:
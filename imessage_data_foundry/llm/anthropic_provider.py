@@ -1,3 +1,4 @@
+import asyncio
 import json
 import re
 from typing import Any
@@ -18,6 +19,7 @@ class AnthropicProvider(LLMProvider):
     def __init__(self, config: LLMConfig | None = None):
         self.config = config or LLMConfig()
         self._client: AsyncAnthropic | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
 
     @property
     def name(self) -> str:
@@ -36,8 +38,10 @@ class AnthropicProvider(LLMProvider):
         return None
 
     def _get_client(self) -> AsyncAnthropic:
-        if self._client is None:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
             self._client = AsyncAnthropic(api_key=self.config.anthropic_api_key)
+            self._client_loop = loop
         return self._client
 
     async def generate_text(self, prompt: str, max_tokens: int = 150) -> str:
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from imessage_data_foundry.llm.anthropic_provider import AnthropicProvider
 from imessage_data_foundry.llm.base import LLMProvider
 from imessage_data_foundry.llm.config import LLMConfig, ProviderType
@@ -121,3 +123,9 @@ class ProviderManager:
                 f"{'Set the API key.' if provider.requires_api_key else 'Install mlx-lm.'}"
             )
         return provider
+
+
+@lru_cache(maxsize=1)
+def get_provider_manager() -> ProviderManager:
+    """Process-wide manager so provider selection and the loaded MLX model are reused."""
+    return ProviderManager()
@@ -1,3 +1,4 @@
+import asyncio
 import json
 
 from openai import AsyncOpenAI
@@ -12,6 +13,7 @@ class OpenAIProvider(LLMProvider):
     def __init__(self, config: LLMConfig | None = None):
         self.config = config or LLMConfig()
         self._client: AsyncOpenAI | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
 
     @property
     def name(self) -> str:
@@ -30,8 +32,10 @@ class OpenAIProvider(LLMProvider):
         return None
 
     def _get_client(self) -> AsyncOpenAI:
-        if self._client is None:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
             self._client = AsyncOpenAI(api_key=self.config.openai_api_key)
+            self._client_loop = loop
         return self._client
 
     async def generate_text(self, prompt: str, max_tokens: int = 150) -> str:
@@ -1,5 +1,6 @@
 from datetime import UTC, datetime
 from enum import Enum
+from functools import lru_cache
 from uuid import uuid4
 
 from pydantic import BaseModel, Field, ValidationInfo, computed_field, field_validator
@@ -48,6 +49,14 @@ class ServiceType(str, Enum):
     SMS = "SMS"
 
 
+@lru_cache(maxsize=1024)
+def _display_phone(identifier: str, country_code: str) -> str:
+    try:
+        return format_national(identifier, country_code)
+    except Exception:
+        return identifier
+
+
 class Persona(BaseModel):
     """A persona representing a contact in generated conversations."""
 
@@ -89,10 +98,7 @@ class Persona(BaseModel):
     def display_identifier(self) -> str:
         if self.identifier_type == IdentifierType.EMAIL:
             return self.identifier
-        try:
-            return format_national(self.identifier, self.country_code)
-        except Exception:
-            return self.identifier
+        return _display_phone(self.identifier, self.country_code)
 
 
 class ConversationConfig(BaseModel):
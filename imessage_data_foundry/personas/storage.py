@@ -1,5 +1,6 @@
 import json
 import sqlite3
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Self
@@ -15,6 +16,12 @@ from imessage_data_foundry.personas.models import (
 )
 from imessage_data_foundry.utils.paths import get_default_db_path
 
+IDENTIFIER_TYPE_BY_VALUE = {m.value: m for m in IdentifierType}
+COMMUNICATION_FREQUENCY_BY_VALUE = {m.value: m for m in CommunicationFrequency}
+RESPONSE_TIME_BY_VALUE = {m.value: m for m in ResponseTime}
+EMOJI_USAGE_BY_VALUE = {m.value: m for m in EmojiUsage}
+VOCABULARY_LEVEL_BY_VALUE = {m.value: m for m in VocabularyLevel}
+
 
 class PersonaNotFoundError(Exception):
     """Raised when a persona is not found."""
@@ -106,9 +113,13 @@ class PersonaStorage:
             raise PersonaNotFoundError(f"Persona not found: {persona_id}")
         self.connection.commit()
 
+    def iter_all(self) -> Iterator[Persona]:
+        """Yield personas row by row without materializing the full list."""
+        for row in self.connection.execute(sql.SELECT_ALL):
+            yield self._row_to_persona(row)
+
     def list_all(self) -> list[Persona]:
-        cursor = self.connection.execute(sql.SELECT_ALL)
-        return [self._row_to_persona(row) for row in cursor.fetchall()]
+        return list(self.iter_all())
 
     def count(self) -> int:
         cursor = self.connection.execute(sql.SELECT_COUNT)
@@ -132,7 +143,7 @@ class PersonaStorage:
 
     def export_all(self) -> list[dict[str, Any]]:
         """Export all personas as JSON-serializable dicts."""
-        return [p.model_dump(mode="json") for p in self.list_all()]
+        return [p.model_dump(mode="json") for p in self.iter_all()]
 
     def import_personas(self, data: list[dict[str, Any]], replace: bool = False) -> list[Persona]:
         """Import personas from JSON data."""
@@ -178,15 +189,17 @@ class PersonaStorage:
             id=row["id"],
             name=row["name"],
             identifier=row["identifier"],
-            identifier_type=IdentifierType(row["identifier_type"]),
+            identifier_type=IDENTIFIER_TYPE_BY_VALUE[row["identifier_type"]],
             country_code=row["country_code"],
             personality=row["personality"] or "",
             writing_style=row["writing_style"] or "",
             relationship=row["relationship"] or "",
-            communication_frequency=CommunicationFrequency(row["communication_frequency"]),
-            typical_response_time=ResponseTime(row["typical_response_time"]),
-            emoji_usage=EmojiUsage(row["emoji_usage"]),
-            vocabulary_level=VocabularyLevel(row["vocabulary_level"]),
+            communication_frequency=COMMUNICATION_FREQUENCY_BY_VALUE[
+                row["communication_frequency"]
+            ],
+            typical_response_time=RESPONSE_TIME_BY_VALUE[row["typical_response_time"]],
+            emoji_usage=EMOJI_USAGE_BY_VALUE[row["emoji_usage"]],
+            vocabulary_level=VOCABULARY_LEVEL_BY_VALUE[row["vocabulary_level"]],
             topics_of_interest=topics,
             is_self=bool(row["is_self"]),
             created_at=datetime.fromisoformat(row["created_at"]),
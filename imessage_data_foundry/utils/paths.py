@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from imessage_data_foundry.utils.constants import (
@@ -7,8 +8,8 @@ from imessage_data_foundry.utils.constants import (
 )
 
 
-def get_default_db_path() -> Path:
-    config_path = os.environ.get(FOUNDRY_CONFIG_ENV_VAR)
+@lru_cache(maxsize=8)
+def _resolve_db_path(config_path: str | None) -> Path:
     if config_path:
         return Path(config_path).parent / FOUNDRY_DB_NAME
 
@@ -17,3 +18,7 @@ def get_default_db_path() -> Path:
         return xdg_path
 
     return Path("./data") / FOUNDRY_DB_NAME
+
+
+def get_default_db_path() -> Path:
+    return _resolve_db_path(os.environ.get(FOUNDRY_CONFIG_ENV_VAR))
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import phonenumbers
 from faker import Faker
 from phonenumbers import PhoneNumber, PhoneNumberFormat
@@ -71,10 +73,14 @@ def get_region_code(number: str | PhoneNumber) -> str | None:
     return phonenumbers.region_code_for_number(number)
 
 
+@lru_cache(maxsize=len(LOCALE_MAP))
+def _get_faker(locale: str) -> Faker:
+    return Faker(locale)
+
+
 def generate_fake_phone(region: str = "US") -> str:
     """Generate a fake phone number in E.164 format."""
-    locale = LOCALE_MAP.get(region, "en_US")
-    fake = Faker(locale)
+    fake = _get_faker(LOCALE_MAP.get(region, "en_US"))
 
     for _ in range(10):
         raw_number = fake.phone_number()
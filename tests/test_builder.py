@@ -26,6 +26,20 @@ class TestDatabaseBuilderInit:
             builder.add_handle("+15551234567")
         assert db_path.exists()
 
+    def test_applies_default_pragmas(self, tmp_path: Path):
+        builder = DatabaseBuilder(tmp_path / "test.db", version="sequoia")
+        assert builder.connection.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert builder.connection.execute("PRAGMA temp_store").fetchone()[0] == 2
+        builder.close()
+
+    def test_custom_pragmas_override_defaults(self, tmp_path: Path):
+        builder = DatabaseBuilder(
+            tmp_path / "test.db", version="sequoia", pragmas={"synchronous": "FULL"}
+        )
+        assert builder.connection.execute("PRAGMA synchronous").fetchone()[0] == 2
+        assert builder.connection.execute("PRAGMA temp_store").fetchone()[0] == 2
+        builder.close()
+
 
 class TestDatabaseBuilderContextManager:
     def test_creates_database_file(self, tmp_path: Path):
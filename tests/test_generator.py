@@ -239,6 +239,18 @@ class TestConversationGenerator:
 
         assert result.generation_time_seconds > 0
 
+    @pytest.mark.asyncio
+    async def test_resolves_provider_once(self, generator, mock_provider_manager, sample_personas):
+        config = make_config(
+            participants=[p.id for p in sample_personas],
+            message_count=5,
+        )
+
+        await generator.generate(sample_personas, config)
+        await generator.generate(sample_personas, config)
+
+        mock_provider_manager.get_provider.assert_awaited_once()
+
 
 class TestFormatPersonasForLLM:
     def test_includes_required_fields(self):
@@ -1,9 +1,14 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from imessage_data_foundry.llm.config import LLMConfig, ProviderType
-from imessage_data_foundry.llm.manager import ProviderManager, ProviderNotAvailableError
+from imessage_data_foundry.llm.manager import (
+    ProviderManager,
+    ProviderNotAvailableError,
+    get_provider_manager,
+)
 
 
 class TestProviderManager:
@@ -17,6 +22,22 @@ class TestProviderManager:
         manager = ProviderManager(config)
         assert manager.config.temperature == 0.5
 
+    def test_shared_manager_is_reused(self):
+        assert get_provider_manager() is get_provider_manager()
+
+    @pytest.mark.parametrize("provider_type", [ProviderType.OPENAI, ProviderType.ANTHROPIC])
+    def test_sdk_client_not_shared_across_event_loops(self, provider_type: ProviderType):
+        config = LLMConfig(openai_api_key="test", anthropic_api_key="test")
+        provider = ProviderManager(config)._get_provider_instance(provider_type)
+
+        async def get_clients() -> tuple[object, object]:
+            return provider._get_client(), provider._get_client()  # type: ignore[attr-defined]
+
+        first_a, first_b = asyncio.run(get_clients())
+        second, _ = asyncio.run(get_clients())
+        assert first_a is first_b
+        assert second is not first_a
+
 
 class TestGetProvider:
     @pytest.mark.asyncio
@@ -115,6 +115,22 @@ class TestPersonaTopicsValidation:
         assert persona.topics_of_interest == ["movies", "hiking"]
 
 
+class TestPersonaDisplayIdentifier:
+    def test_phone_formatted_nationally(self):
+        persona = Persona(name="Test", identifier="+12025551234")
+        assert persona.display_identifier == "(202) 555-1234"
+
+    def test_email_unchanged(self):
+        persona = Persona(
+            name="Test", identifier="test@example.com", identifier_type=IdentifierType.EMAIL
+        )
+        assert persona.display_identifier == "test@example.com"
+
+    def test_unparseable_phone_falls_back(self):
+        persona = Persona(name="Test", identifier="not-a-number")
+        assert persona.display_identifier == "not-a-number"
+
+
 class TestConversationConfigCreation:
     def test_minimal_config(self):
         config = ConversationConfig(
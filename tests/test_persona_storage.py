@@ -99,6 +99,13 @@ class TestGetDefaultDbPath:
         path = get_default_db_path()
         assert path == tmp_path / "config" / "foundry.db"
 
+    def test_tracks_env_var_changes(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+        monkeypatch.setenv("IMESSAGE_FOUNDRY_CONFIG", str(tmp_path / "a" / "settings.toml"))
+        first = get_default_db_path()
+        monkeypatch.setenv("IMESSAGE_FOUNDRY_CONFIG", str(tmp_path / "b" / "settings.toml"))
+        assert first == tmp_path / "a" / "foundry.db"
+        assert get_default_db_path() == tmp_path / "b" / "foundry.db"
+
 
 class TestCreate:
     def test_creates_persona(self, storage: PersonaStorage, sample_persona: Persona):
@@ -241,6 +248,21 @@ class TestListAll:
         assert storage.list_all() == []
 
 
+class TestIterAll:
+    def test_yields_lazily_in_name_order(self, storage: PersonaStorage):
+        personas = [
+            Persona(name="Bob", identifier="+15552222222"),
+            Persona(name="Alice", identifier="+15551111111"),
+        ]
+        storage.create_many(personas)
+        results = storage.iter_all()
+        assert next(results).name == "Alice"
+        assert [p.name for p in results] == ["Bob"]
+
+    def test_empty(self, storage: PersonaStorage):
+        assert list(storage.iter_all()) == []
+
+
 class TestCount:
     def test_returns_count(self, storage: PersonaStorage):
         assert storage.count() == 0
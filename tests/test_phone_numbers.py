@@ -119,6 +119,10 @@ class TestGenerateFakePhone:
         assert us_phone.startswith("+")
         assert gb_phone.startswith("+")
 
+    def test_successive_calls_differ(self):
+        phones = {generate_fake_phone("US") for _ in range(5)}
+        assert len(phones) > 1
+
 
 class TestNormalizeIdentifier:
     def test_phone_to_e164(self):
@@ -0,0 +1,39 @@
+from unittest.mock import MagicMock
+
+from imessage_data_foundry.cli.components.progress import create_progress_callback
+from imessage_data_foundry.conversations.generator import GenerationPhase, GenerationProgress
+
+
+def make_progress(
+    generated: int, phase: GenerationPhase = GenerationPhase.GENERATING
+) -> GenerationProgress:
+    return GenerationProgress(
+        total_messages=100,
+        generated_messages=generated,
+        current_batch=1,
+        total_batches=4,
+        phase=phase,
+    )
+
+
+class TestCreateProgressCallback:
+    def test_skips_unchanged_updates(self):
+        progress = MagicMock()
+        callback = create_progress_callback(progress, task_id=MagicMock())
+
+        callback(make_progress(25))
+        callback(make_progress(25))
+        callback(make_progress(50))
+
+        assert progress.update.call_count == 2
+        assert progress.update.call_args.kwargs["completed"] == 50
+
+    def test_phase_change_is_forwarded(self):
+        progress = MagicMock()
+        callback = create_progress_callback(progress, task_id=MagicMock())
+
+        callback(make_progress(100))
+        callback(make_progress(100, GenerationPhase.WRITING_DATABASE))
+
+        assert progress.update.call_count == 2
+        assert progress.update.call_args.kwargs["phase"] == "Writing to database"